@@ -19,6 +19,7 @@ import time
 import hashlib
 import secrets
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 # Supabase Storage imports
 from supabase import create_client, Client
@@ -235,6 +236,110 @@ logger.info("Timeline service initialized successfully")
 # Database Initialization
 # ================================
 
+# Secondary indexes created on startup, as (index_name, table_name, column_name)
+DB_INDEXES = [
+    ("idx_users_firebase_uid", "users", "firebase_uid"),
+    ("idx_users_email", "users", "email"),
+    ("idx_issues_created_by", "issues", "created_by"),
+    ("idx_issues_category", "issues", "category"),
+    ("idx_issues_status", "issues", "status"),
+    ("idx_comments_issue_id", "comments", "issue_id"),
+    ("idx_comments_user_id", "comments", "user_id"),
+]
+
+# Advisory lock key so only one process (of several gunicorn workers) builds indexes
+INDEX_LOCK_KEY = 4214829301
+
+def existing_index_names(engine):
+    """Return which DB_INDEXES exist and are valid, looked up in a single query
+
+    A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind; it is
+    not counted here so the next run rebuilds it.
+    """
+    with engine.connect() as conn:
+        result = conn.execute(
+            db.text("""
+                SELECT c.relname FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                WHERE c.relname = ANY(:names)
+                  AND c.relnamespace = current_schema()::regnamespace
+                  AND i.indisvalid
+            """),
+            {'names': [index_name for index_name, _, _ in DB_INDEXES]}
+        )
+        return {row[0] for row in result}
+
+def _build_table_indexes(engine, indexes):
+    """Build one table's indexes in turn; returns (created, failed)"""
+    created, failed = [], []
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index_name, table_name, column_name in indexes:
+            try:
+                # Clear any INVALID leftover, which IF NOT EXISTS would otherwise keep
+                conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+                conn.exec_driver_sql(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name}({column_name})"
+                )
+                created.append(index_name)
+            except Exception as idx_error:
+                failed.append((index_name, idx_error))
+                try:
+                    conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+                except Exception:
+                    pass
+    return created, failed
+
+def ensure_indexes(engine):
+    """Create missing or invalid DB_INDEXES without blocking writes to their tables
+
+    Returns (created, skipped, failed), or None when another process holds the
+    index lock. Builds on the same table block each other, so each table's
+    indexes are built in sequence and only different tables run in parallel.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        # Non-blocking on purpose: a session waiting on the lock would hold a
+        # snapshot that CREATE INDEX CONCURRENTLY has to wait for
+        if not lock_conn.execute(db.text("SELECT pg_try_advisory_lock(:key)"),
+                                 {'key': INDEX_LOCK_KEY}).scalar():
+            return None
+        try:
+            valid_indexes = existing_index_names(engine)
+            skipped = [index[0] for index in DB_INDEXES if index[0] in valid_indexes]
+            
+            by_table = {}
+            for index in DB_INDEXES:
+                if index[0] not in valid_indexes:
+                    by_table.setdefault(index[1], []).append(index)
+            
+            created, failed = [], []
+            if by_table:
+                with ThreadPoolExecutor(max_workers=len(by_table)) as executor:
+                    for table_created, table_failed in executor.map(
+                            lambda indexes: _build_table_indexes(engine, indexes), by_table.values()):
+                        created.extend(table_created)
+                        failed.extend(table_failed)
+            return created, skipped, failed
+        finally:
+            lock_conn.execute(db.text("SELECT pg_advisory_unlock(:key)"), {'key': INDEX_LOCK_KEY})
+
+def table_summary(engine):
+    """Return (table, column_count, index_count) for every table in one query"""
+    with engine.connect() as conn:
+        return conn.execute(db.text("""
+            SELECT t.table_name,
+                   (SELECT COUNT(*) FROM information_schema.columns c
+                    WHERE c.table_schema = t.table_schema
+                      AND c.table_name = t.table_name) AS column_count,
+                   (SELECT COUNT(*) FROM pg_index ix
+                    WHERE ix.indrelid = (quote_ident(t.table_schema) || '.' || quote_ident(t.table_name))::regclass
+                      AND NOT ix.indisprimary) AS index_count
+            FROM information_schema.tables t
+            WHERE t.table_schema = current_schema()
+              AND t.table_type = 'BASE TABLE'
+            ORDER BY t.table_name
+        """)).fetchall()
+
 def init_database():
     """Initialize database tables using SQLAlchemy"""
     try:
@@ -256,53 +361,30 @@ def init_database():
             
             # Create indexes for better performance
             try:
-                indexes_to_create = [
-                    ("idx_users_firebase_uid", "users", "firebase_uid"),
-                    ("idx_users_email", "users", "email"),
-                    ("idx_issues_created_by", "issues", "created_by"),
-                    ("idx_issues_category", "issues", "category"),
-                    ("idx_issues_status", "issues", "status"),
-                    ("idx_comments_issue_id", "comments", "issue_id"),
-                    ("idx_comments_user_id", "comments", "user_id"),
-                ]
-                
-                for index_name, table_name, column_name in indexes_to_create:
-                    try:
-                        # Use a new connection for each index to avoid transaction issues
-                        with db.engine.begin() as conn:
-                            # Check if index exists
-                            result = conn.execute(db.text(f"""
-                                SELECT 1 FROM pg_indexes 
-                                WHERE indexname = '{index_name}'
-                            """))
-                            
-                            if not result.fetchone():
-                                # Create index
-                                conn.execute(db.text(f"""
-                                    CREATE INDEX IF NOT EXISTS {index_name} 
-                                    ON {table_name}({column_name})
-                                """))
-                                logger.info(f"   ✅ Created index: {index_name}")
-                            else:
-                                logger.info(f"   ℹ️  Index already exists: {index_name}")
-                    except Exception as idx_error:
+                outcome = ensure_indexes(db.engine)
+                if outcome is None:
+                    logger.info("   ℹ️  Indexes are being built by another process")
+                else:
+                    created, skipped, failed = outcome
+                    for index_name in skipped:
+                        logger.info(f"   ℹ️  Index already exists: {index_name}")
+                    for index_name in created:
+                        logger.info(f"   ✅ Created index: {index_name}")
+                    for index_name, idx_error in failed:
                         logger.warning(f"   ⚠️  Could not create index {index_name}: {idx_error}")
                     
             except Exception as idx_error:
                 logger.warning(f"⚠️  Index creation failed: {idx_error}")
             
             # Verify tables were created
-            inspector = db.inspect(db.engine)
-            tables = inspector.get_table_names()
+            tables = table_summary(db.engine)
             
             if tables:
-                logger.info(f"✅ Database initialized successfully with tables: {', '.join(tables)}")
+                logger.info(f"✅ Database initialized successfully with tables: {', '.join(table for table, _, _ in tables)}")
                 
                 # Log table details
-                for table in tables:
-                    columns = inspector.get_columns(table)
-                    column_names = [col['name'] for col in columns]
-                    logger.info(f"   📊 Table '{table}': {len(column_names)} columns")
+                for table, column_count, _ in tables:
+                    logger.info(f"   📊 Table '{table}': {column_count} columns")
             else:
                 logger.warning("⚠️  No tables found after initialization")
                 
@@ -314,10 +396,13 @@ def init_database():
             logger.warning("Continuing despite database initialization failure (validation skipped)")
 
 # Initialize database on startup
-if os.environ.get('SKIP_VALIDATION') != 'true':
-    init_database()
-else:
+if os.environ.get('SKIP_VALIDATION') == 'true':
     logger.info("Database initialization skipped (SKIP_VALIDATION=true)")
+elif os.environ.get('WERKZEUG_RUN_MAIN') == 'true' and os.environ.get('DB_INITIALIZED') == 'true':
+    # Dev-server reloader child started by startup.py, which already initialized
+    logger.info("Database initialization skipped (done by the reloader parent)")
+else:
+    init_database()
 
 # ================================
 # Models
@@ -2923,36 +3008,29 @@ def get_stats():
     try:
         logger.info("Stats endpoint called")
         
-        try:
-            total_issues = Issue.query.count()
-            logger.info(f"Total issues: {total_issues}")
-        except Exception as issue_error:
-            logger.error(f"Error counting issues: {issue_error}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return jsonify({'error': 'Database error: Issue table'}), 500
+        statuses = ['open', 'in_progress', 'resolved', 'closed']
+        categories = ['roads', 'water', 'electricity', 'waste', 'public_safety', 'other']
         
+        # Compute every figure in a single round-trip instead of one COUNT per value
         try:
-            total_users = User.query.count()
-            logger.info(f"Total users: {total_users}")
-        except Exception as user_error:
-            logger.error(f"Error counting users: {user_error}")
+            counts = db.session.query(
+                db.select(db.func.count(User.id)).scalar_subquery(),
+                db.func.count(Issue.id),
+                *(db.func.count(Issue.id).filter(Issue.status == status) for status in statuses),
+                *(db.func.count(Issue.id).filter(Issue.category == category) for category in categories)
+            ).one()
+        except Exception as count_error:
+            logger.error(f"Error counting stats: {count_error}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
-            return jsonify({'error': 'Database error: User table'}), 500
+            return jsonify({'error': 'Database error: stats query'}), 500
         
-        # Issues by status
-        issues_by_status = {}
-        for status in ['open', 'in_progress', 'resolved', 'closed']:
-            count = Issue.query.filter_by(status=status).count()
-            issues_by_status[status] = count
+        total_users, total_issues = counts[0], counts[1]
+        logger.info(f"Total issues: {total_issues}")
+        logger.info(f"Total users: {total_users}")
         
-        # Issues by category
-        issues_by_category = {}
-        categories = ['roads', 'water', 'electricity', 'waste', 'public_safety', 'other']
-        for category in categories:
-            count = Issue.query.filter_by(category=category).count()
-            issues_by_category[category] = count
+        issues_by_status = dict(zip(statuses, counts[2:2 + len(statuses)]))
+        issues_by_category = dict(zip(categories, counts[2 + len(statuses):]))
         
         return jsonify({
             'total_issues': total_issues,
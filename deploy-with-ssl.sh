@@ -152,25 +152,19 @@ print_info "Starting services..."
 docker-compose up -d
 
 print_info "Waiting for backend to be healthy..."
-sleep 10
-
-# Check backend health
-MAX_RETRIES=12
-RETRY_COUNT=0
-while [ $RETRY_COUNT -lt $MAX_RETRIES ]; do
-    if curl -f http://localhost/health > /dev/null 2>&1; then
-        print_success "Backend is healthy!"
-        break
-    fi
-    RETRY_COUNT=$((RETRY_COUNT + 1))
-    if [ $RETRY_COUNT -eq $MAX_RETRIES ]; then
-        print_error "Backend health check failed!"
+
+# Poll health every half second and continue as soon as the backend answers
+HEALTH_TIMEOUT=70
+HEALTH_DEADLINE=$((SECONDS + HEALTH_TIMEOUT))
+until curl -f --max-time 2 http://localhost/health > /dev/null 2>&1; do
+    if [ $SECONDS -ge $HEALTH_DEADLINE ]; then
+        print_error "Backend health check failed after ${HEALTH_TIMEOUT}s!"
         print_info "Check logs: docker-compose logs backend"
         exit 1
     fi
-    print_info "Waiting for backend... ($RETRY_COUNT/$MAX_RETRIES)"
-    sleep 5
+    sleep 0.5
 done
+print_success "Backend is healthy! (after $((SECONDS + HEALTH_TIMEOUT - HEALTH_DEADLINE))s)"
 
 # Test HTTP
 print_info "Testing HTTP access..."
@@ -251,22 +245,20 @@ docker-compose down
 sleep 2
 docker-compose up -d
 
-print_info "Waiting for services to start..."
-sleep 10
-
 ################################################################################
 # Test HTTPS
 ################################################################################
 
 print_header "Step 8: Testing HTTPS"
 
-# Test HTTPS
-MAX_RETRIES=12
-RETRY_COUNT=0
+# Test HTTPS, polling from the moment the services are up instead of
+# sleeping a fixed interval before the first attempt
+HTTPS_TIMEOUT=70
+HTTPS_DEADLINE=$((SECONDS + HTTPS_TIMEOUT))
 print_info "Testing HTTPS connection..."
 
-while [ $RETRY_COUNT -lt $MAX_RETRIES ]; do
-    if curl -f -k https://$DOMAIN/health > /dev/null 2>&1; then
+while true; do
+    if curl -f -k --max-time 5 https://$DOMAIN/health > /dev/null 2>&1; then
         print_success "HTTPS is working!"
         
         # Test certificate validity
@@ -278,15 +270,13 @@ while [ $RETRY_COUNT -lt $MAX_RETRIES ]; do
         break
     fi
     
-    RETRY_COUNT=$((RETRY_COUNT + 1))
-    if [ $RETRY_COUNT -eq $MAX_RETRIES ]; then
-        print_warning "HTTPS test failed"
+    if [ $SECONDS -ge $HTTPS_DEADLINE ]; then
+        print_warning "HTTPS test failed after ${HTTPS_TIMEOUT}s"
         print_info "This might be due to DNS propagation delay"
         print_info "Check logs: docker-compose logs nginx"
         break
     fi
-    print_info "Waiting for HTTPS... ($RETRY_COUNT/$MAX_RETRIES)"
-    sleep 5
+    sleep 1
 done
 
 # Test HTTP redirect
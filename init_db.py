@@ -23,7 +23,7 @@ def init_database():
     """Initialize database with all tables and indexes"""
     try:
         # Import app and db after environment is loaded
-        from app import app, db
+        from app import app, db, ensure_indexes, table_summary
         
         logger.info("=" * 60)
         logger.info("CivicFix Database Initialization")
@@ -75,38 +75,20 @@ def init_database():
             indexes_created = 0
             indexes_skipped = 0
             
-            indexes_to_create = [
-                ("idx_users_firebase_uid", "users", "firebase_uid"),
-                ("idx_users_email", "users", "email"),
-                ("idx_issues_created_by", "issues", "created_by"),
-                ("idx_issues_category", "issues", "category"),
-                ("idx_issues_status", "issues", "status"),
-                ("idx_comments_issue_id", "comments", "issue_id"),
-                ("idx_comments_user_id", "comments", "user_id"),
-            ]
-            
-            for index_name, table_name, column_name in indexes_to_create:
-                try:
-                    # Use a new connection for each index to avoid transaction issues
-                    with db.engine.begin() as conn:
-                        # Check if index exists
-                        result = conn.execute(db.text(f"""
-                            SELECT 1 FROM pg_indexes 
-                            WHERE indexname = '{index_name}'
-                        """))
-                        
-                        if not result.fetchone():
-                            # Create index
-                            conn.execute(db.text(f"""
-                                CREATE INDEX IF NOT EXISTS {index_name} 
-                                ON {table_name}({column_name})
-                            """))
-                            logger.info(f"   ✅ Created: {index_name}")
-                            indexes_created += 1
-                        else:
-                            logger.info(f"   ⏭️  Skipped: {index_name} (already exists)")
-                            indexes_skipped += 1
-                except Exception as idx_error:
+            # Builds missing or INVALID indexes with CREATE INDEX CONCURRENTLY;
+            # importing app has usually done this already, leaving only skips
+            outcome = ensure_indexes(db.engine)
+            if outcome is None:
+                logger.info("   ⏭️  Skipped: another process is building indexes")
+            else:
+                created, skipped, failed = outcome
+                for index_name in skipped:
+                    logger.info(f"   ⏭️  Skipped: {index_name} (already exists)")
+                    indexes_skipped += 1
+                for index_name in created:
+                    logger.info(f"   ✅ Created: {index_name}")
+                    indexes_created += 1
+                for index_name, idx_error in failed:
                     logger.warning(f"   ⚠️  Failed: {index_name} - {idx_error}")
             
             logger.info("")
@@ -115,16 +97,14 @@ def init_database():
             
             # Verify final state
             logger.info("🔍 Verifying database structure...")
-            inspector = db.inspect(db.engine)
-            final_tables = inspector.get_table_names()
+            # Column and index counts for every table in one round-trip
+            final_tables = table_summary(db.engine)
             
             logger.info(f"✅ Database has {len(final_tables)} tables:")
-            for table in final_tables:
-                columns = inspector.get_columns(table)
-                indexes = inspector.get_indexes(table)
+            for table, column_count, index_count in final_tables:
                 logger.info(f"   📊 {table}:")
-                logger.info(f"      - Columns: {len(columns)}")
-                logger.info(f"      - Indexes: {len(indexes)}")
+                logger.info(f"      - Columns: {column_count}")
+                logger.info(f"      - Indexes: {index_count}")
             
             logger.info("")
             logger.info("=" * 60)
@@ -0,0 +1,41 @@
+"""
+CivicFix Load Test
+Measures throughput and p50/p95/p99 latency of the public API with Locust
+
+Install locust separately (it is not a runtime dependency):
+    pip install locust
+
+Run headless against the deployed backend:
+    locust -f locustfile.py --headless -u 50 -r 10 -t 30s --host https://civicfix-server.asolvitra.tech
+
+Omit --headless to use the web UI on http://localhost:8089
+"""
+
+from locust import HttpUser, task, between
+
+# Sample coordinates for nearby issues; get_nearby_issues requires latitude/longitude
+NEARBY_QUERY = "/api/v1/issues/nearby?latitude=12.9716&longitude=77.5946&radius=5"
+
+class CivicUser(HttpUser):
+    """Anonymous mobile-app user browsing public endpoints"""
+    wait_time = between(1, 3)
+
+    @task(5)
+    def list_issues(self):
+        self.client.get("/api/v1/issues")
+
+    @task(3)
+    def nearby_issues(self):
+        self.client.get(NEARBY_QUERY, name="/api/v1/issues/nearby")
+
+    @task(2)
+    def categories(self):
+        self.client.get("/api/v1/categories")
+
+    @task(1)
+    def stats(self):
+        self.client.get("/api/v1/stats")
+
+    @task(1)
+    def health(self):
+        self.client.get("/health")
@@ -4,6 +4,7 @@ No Docker, no running server needed
 """
 
 import os
+import re
 import sys
 
 def check(condition, name):
@@ -15,6 +16,22 @@ def check(condition, name):
         print(f"✗ {name}")
         return False
 
+def scan(path, needles):
+    """Return the needles found in a file using a single regex pass over its bytes"""
+    encoded = {n.encode(): n for n in needles}
+    # A zero-width lookahead stops at every offset where any needle starts, so
+    # overlapping needles and needles that prefix one another are all reported
+    pattern = re.compile(b'(?=' + b'|'.join(map(re.escape, encoded)) + b')')
+    with open(path, 'rb') as f:
+        content = f.read()
+    found = set()
+    for match in pattern.finditer(content):
+        start = match.start()
+        found.update(n for raw, n in encoded.items() if content.startswith(raw, start))
+        if len(found) == len(encoded):
+            break
+    return found
+
 print("=" * 50)
 print("Quick Backend Validation")
 print("=" * 50)
@@ -26,19 +43,22 @@ if os.path.exists('backend'):
 
 results = []
 
+# List the directory once instead of stat-ing every file separately
+with os.scandir('.') as entries:
+    present = {entry.name for entry in entries if entry.is_file()}
+
 # Essential files
 print("Files:")
-results.append(check(os.path.exists('app.py'), "app.py exists"))
-results.append(check(os.path.exists('requirements.txt'), "requirements.txt exists"))
-results.append(check(os.path.exists('Procfile'), "Procfile exists"))
-results.append(check(os.path.exists('runtime.txt'), "runtime.txt exists"))
+results.append(check('app.py' in present, "app.py exists"))
+results.append(check('requirements.txt' in present, "requirements.txt exists"))
+results.append(check('Procfile' in present, "Procfile exists"))
+results.append(check('runtime.txt' in present, "runtime.txt exists"))
 print()
 
 # Requirements content
 print("Requirements:")
-if os.path.exists('requirements.txt'):
-    with open('requirements.txt', 'r') as f:
-        reqs = f.read()
+if 'requirements.txt' in present:
+    reqs = scan('requirements.txt', ('Flask', 'gunicorn', 'psycopg2', 'supabase'))
     results.append(check('Flask' in reqs, "Flask included"))
     results.append(check('gunicorn' in reqs, "gunicorn included"))
     results.append(check('psycopg2' in reqs, "psycopg2 included"))
@@ -47,18 +67,16 @@ print()
 
 # Procfile content
 print("Procfile:")
-if os.path.exists('Procfile'):
-    with open('Procfile', 'r') as f:
-        procfile = f.read()
+if 'Procfile' in present:
+    procfile = scan('Procfile', ('gunicorn', 'app:app'))
     results.append(check('gunicorn' in procfile, "Uses gunicorn"))
     results.append(check('app:app' in procfile, "Correct app reference"))
 print()
 
 # App.py content
 print("App Structure:")
-if os.path.exists('app.py'):
-    with open('app.py', 'r', encoding='utf-8') as f:
-        app_content = f.read()
+if 'app.py' in present:
+    app_content = scan('app.py', ('Flask(__name__)', 'SQLAlchemy', 'CORS', '@app.route', '@app.'))
     results.append(check('Flask(__name__)' in app_content, "Flask app initialized"))
     results.append(check('SQLAlchemy' in app_content, "Database configured"))
     results.append(check('CORS' in app_content, "CORS enabled"))
@@ -28,34 +28,17 @@ def load_env_file():
     logger.info("📄 Loading environment variables from .env file...")
     
     try:
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse key=value
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Set environment variable
-                    os.environ[key] = value
+        from dotenv import dotenv_values
+        
+        # Keys declared without a value parse as None and are left unset
+        values = dotenv_values(env_file)
+        os.environ.update({key: value for key, value in values.items() if value is not None})
         
         logger.info("✅ Environment variables loaded from .env")
         return True
         
     except Exception as e:
-        logger.error(f"❌ Failed to load .env file: {e}")
+        logger.error("❌ Failed to load .env file: %s", e)
         return False
 
 def check_required_vars():
@@ -68,19 +51,16 @@ def check_required_vars():
         'SUPABASE_KEY'
     ]
     
-    missing_vars = []
-    
     logger.info("🔍 Checking required environment variables...")
     
-    for var in required_vars:
-        if var in os.environ and os.environ[var]:
-            logger.info(f"   ✅ {var} is set")
-        else:
-            missing_vars.append(var)
-            logger.error(f"   ❌ {var} is missing")
+    missing_vars = [var for var in required_vars if not os.environ.get(var)]
     
-    if missing_vars:
-        logger.error(f"❌ Missing required environment variables: {', '.join(missing_vars)}")
+    if not missing_vars:
+        logger.info("   ✅ All required variables are set: %s", ", ".join(required_vars))
+    else:
+        for var in missing_vars:
+            logger.error("   ❌ %s is missing", var)
+        logger.error("❌ Missing required environment variables: %s", ", ".join(missing_vars))
         
         if os.environ.get('SKIP_VALIDATION') != 'true':
             logger.error("Set SKIP_VALIDATION=true to continue anyway (not recommended)")
@@ -96,6 +76,11 @@ def run_initialization():
         logger.info("⚠️  Skipping initialization (SKIP_INIT=true)")
         return True
     
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Dev-server reloader child: the watching parent already initialized
+        logger.info("⚠️  Skipping initialization (reloader child process)")
+        return True
+    
     logger.info("🔧 Running initialization...")
     
     try:
@@ -105,6 +90,11 @@ def run_initialization():
         db_success = init_db.init_database()
         storage_success = init_db.check_supabase_storage()
         
+        if db_success:
+            # Inherited by the dev-server reloader child so app.py's
+            # import-time init does not run again on every reload
+            os.environ['DB_INITIALIZED'] = 'true'
+        
         if db_success and storage_success:
             logger.info("✅ Initialization completed successfully")
             return True
@@ -113,7 +103,7 @@ def run_initialization():
             return True  # Continue anyway
             
     except Exception as e:
-        logger.error(f"❌ Initialization failed: {e}")
+        logger.error("❌ Initialization failed: %s", e)
         
         if os.environ.get('SKIP_VALIDATION') == 'true':
             logger.warning("⚠️  Continuing despite initialization failure (SKIP_VALIDATION=true)")
@@ -124,32 +114,38 @@ def run_initialization():
 def start_app():
     """Start the Flask application"""
     logger.info("🎯 Starting CivicFix Backend...")
-    logger.info(f"   Port: {os.environ.get('PORT', '5000')}")
-    logger.info(f"   Environment: {os.environ.get('FLASK_ENV', 'production')}")
-    logger.info(f"   Database: Neon PostgreSQL")
-    logger.info(f"   Storage: Supabase Storage")
+    logger.info("   Port: %s", os.environ.get('PORT', '5000'))
+    logger.info("   Environment: %s", os.environ.get('FLASK_ENV', 'production'))
+    logger.info("   Database: Neon PostgreSQL")
+    logger.info("   Storage: Supabase Storage")
     logger.info("")
     
     # Import and run the app
     try:
-        import app as app_module
         logger.info("   Using: app.py (Neon + Supabase)")
-        
-        app = app_module.app
         port = int(os.environ.get('PORT', 5000))
         
         if os.environ.get('FLASK_ENV') == 'development':
             logger.info("   Mode: Development (Flask dev server)")
-            app.run(host='0.0.0.0', port=port, debug=True)
+            # Only the dev server runs the app in this process. Unless
+            # SKIP_INIT=true, init_db has already imported it by this point
+            import app as app_module
+            app_module.app.run(host='0.0.0.0', port=port, debug=True)
         else:
             logger.info("   Mode: Production (Gunicorn)")
-            # Use gunicorn
-            import subprocess
+            # Fixed default rather than os.cpu_count(), which reports host cores
+            # inside containers; every worker opens its own database pool
+            workers = os.environ.get('WEB_CONCURRENCY', '4')
+            logger.info("   Workers: %s", workers)
             
-            subprocess.run([
+            # Replace this process with gunicorn so no idle parent keeps the
+            # imported app in memory and signals reach the gunicorn master
+            os.execvp('gunicorn', [
                 'gunicorn',
                 '--bind', f'0.0.0.0:{port}',
-                '--workers', '4',
+                '--workers', workers,
+                '--worker-class', 'gthread',
+                '--threads', os.environ.get('GUNICORN_THREADS', '4'),
                 '--timeout', '120',
                 '--access-logfile', '-',
                 '--error-logfile', '-',
@@ -157,7 +153,7 @@ def start_app():
             ])
             
     except Exception as e:
-        logger.error(f"❌ Failed to start application: {e}")
+        logger.error("❌ Failed to start application: %s", e)
         import traceback
         traceback.print_exc()
         sys.exit(1)
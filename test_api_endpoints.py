@@ -4,52 +4,236 @@ CivicFix API Endpoint Testing Script
 Comprehensive testing of all API endpoints on https://civicfix-server.asolvitra.tech
 """
 
-import requests
+import httpx
 import json
+import os
 import time
 import ssl
+import functools
+import importlib.util
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import NamedTuple
 from urllib.parse import urljoin
 import sys
 
+# orjson is optional; it only speeds up parsing responses and writing the results file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 BASE_URL = "https://civicfix-server.asolvitra.tech"
 DOMAIN = "civicfix-server.asolvitra.tech"
 TIMEOUT = 30
+# Upper bound on probes in flight; also sizes the client's connection pool
+MAX_WORKERS = 8
+# HTTP/2 multiplexes concurrent probes over one connection; needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+class Probe(NamedTuple):
+    """A single endpoint check: request line, label and expected status"""
+    method: str
+    endpoint: str
+    description: str
+    expected_status: int = 200
+
+# Home, backend health and Nginx health are independent probes
+BASIC_PROBES = (
+    Probe('GET', '/', 'Home endpoint'),
+    Probe('GET', '/health', 'Backend health check'),
+    Probe('GET', '/nginx-health', 'Nginx health check')
+)
+# Read-only public endpoints do not depend on each other
+PUBLIC_PROBES = (
+    Probe('GET', '/api/v1/issues', 'Get all issues'),
+    Probe('GET', '/api/v1/categories', 'Get issue categories'),
+    Probe('GET', '/api/v1/status-options', 'Get status options'),
+    Probe('GET', '/api/v1/priority-options', 'Get priority options'),
+    Probe('GET', '/api/v1/stats', 'Get system statistics'),
+    # Sample coordinates for nearby issues; get_nearby_issues requires latitude/longitude
+    Probe('GET', '/api/v1/issues/nearby?latitude=12.9716&longitude=77.5946&radius=5', 'Get nearby issues'),
+    # Might be 404 if no issues exist
+    Probe('GET', '/api/v1/issues/1', 'Get specific issue (ID 1)', 200)
+)
+# These should fail with 401 without authentication
+AUTH_PROBES = (
+    Probe('GET', '/api/v1/users/me', 'Get current user (no auth)', 401),
+    Probe('GET', '/api/v1/auth/test', 'Test authentication (no auth)', 401),
+    Probe('POST', '/api/v1/issues', 'Create issue (no auth)', 401),
+    Probe('POST', '/api/v1/upload', 'Upload file (no auth)', 401)
+)
+ERROR_PROBES = (
+    Probe('GET', '/api/v1/nonexistent', 'Non-existent endpoint', 404),
+    Probe('GET', '/api/v1/issues/99999', 'Invalid issue ID', 404),
+    Probe('DELETE', '/', 'Invalid method on home endpoint', 405)
+)
+
+# Static request/check data, built once at import
+CORS_PREFLIGHT_HEADERS = {
+    'Origin': 'https://example.com',
+    'Access-Control-Request-Method': 'GET'
+}
+SECURITY_HEADERS = (
+    'X-Frame-Options',
+    'X-Content-Type-Options',
+    'X-XSS-Protection',
+    'Referrer-Policy'
+)
+PERF_ENDPOINTS = ('/health', '/api/v1/issues', '/api/v1/categories')
+USEFUL_URLS = tuple(f"{BASE_URL}{path}" for path in (
+    '/',
+    '/health',
+    '/api/v1/issues',
+    '/api/v1/categories',
+    '/api/v1/stats'
+))
+
+# Colors for terminal output (disabled when not a TTY or NO_COLOR is set)
+USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
+def ansi(code):
+    """Return the escape sequence only when color output is enabled"""
+    return code if USE_COLOR else ''
 
-# Colors for terminal output
 class Colors:
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    PURPLE = '\033[0;35m'
-    CYAN = '\033[0;36m'
-    WHITE = '\033[1;37m'
-    RESET = '\033[0m'
+    RED = ansi('\033[0;31m')
+    GREEN = ansi('\033[0;32m')
+    YELLOW = ansi('\033[1;33m')
+    BLUE = ansi('\033[0;34m')
+    PURPLE = ansi('\033[0;35m')
+    CYAN = ansi('\033[0;36m')
+    WHITE = ansi('\033[1;37m')
+    RESET = ansi('\033[0m')
+
+def is_json(response):
+    """Return True if the response declares a JSON body, caching the check on the response"""
+    if not hasattr(response, '_is_json'):
+        content_type = response.headers.get('Content-Type', '')
+        response._is_json = content_type.split(';', 1)[0].strip().lower() == 'application/json'
+    return response._is_json
+
+@functools.cache
+def tls_context():
+    """Default verifying TLS context; loading the CA bundle is done once per process"""
+    return ssl.create_default_context()
+
+PREVIEW_ENCODER = json.JSONEncoder(indent=2)
+
+def json_preview(data, limit=200):
+    """Pretty-print only as much of a JSON value as the preview shows"""
+    pieces = []
+    size = 0
+    for chunk in PREVIEW_ENCODER.iterencode(data):
+        pieces.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return ''.join(pieces)[:limit]
+
+def write_json(path, payload):
+    """Write payload as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=2)
+
+def response_json(response):
+    """Parse a response body once and cache the result on the response"""
+    if not hasattr(response, '_parsed_json'):
+        # orjson parses the raw bytes directly; its decode error is a ValueError too
+        if orjson is not None:
+            response._parsed_json = orjson.loads(response.content)
+        else:
+            response._parsed_json = response.json()
+    return response._parsed_json
 
 class APITester:
     def __init__(self, base_url):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.timeout = TIMEOUT
+        # Absolute URLs for every known endpoint, joined once up front
+        known = [probe.endpoint for probes in (BASIC_PROBES, PUBLIC_PROBES, AUTH_PROBES, ERROR_PROBES)
+                 for probe in probes]
+        self.urls = {endpoint: urljoin(base_url, endpoint) for endpoint in (*known, *PERF_ENDPOINTS)}
+        self.client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=MAX_WORKERS)
+        )
         self.results = {
             'passed': 0,
             'failed': 0,
             'warnings': 0,
             'tests': []
         }
+        # Guards results and the output buffer while probes run on worker threads
+        self._lock = threading.Lock()
+        # Output lines are buffered and written once per suite
+        self._buf = []
+        # Wall-clock start of the run, set once by run_all_tests and reused
+        # by the summary and results file
+        self.started_at = None
+        
+    def url(self, endpoint):
+        """Absolute URL for an endpoint, precomputed for the known probes"""
+        url = self.urls.get(endpoint)
+        return url if url is not None else urljoin(self.base_url, endpoint)
+        
+    def write(self, line):
+        """Buffer a plain output line"""
+        with self._lock:
+            self._buf.append(line)
         
     def log(self, message, color=Colors.WHITE):
-        """Print colored log message"""
-        print(f"{color}{message}{Colors.RESET}")
+        """Buffer colored log message"""
+        self.write(f"{color}{message}{Colors.RESET}" if USE_COLOR else message)
+        
+    def flush(self):
+        """Write all buffered output to stdout in a single call"""
+        with self._lock:
+            if self._buf:
+                sys.stdout.write("\n".join(self._buf) + "\n")
+                sys.stdout.flush()
+                self._buf.clear()
+        
+    def record(self, status, result, lines):
+        """Count a finished test and buffer its output as one block"""
+        with self._lock:
+            if status == 'PASS':
+                self.results['passed'] += 1
+            else:
+                self.results['failed'] += 1
+            self.results['tests'].append(result)
+            self._buf.extend(lines)
+        
+    def run_concurrently(self, probes):
+        """Run independent Probes in parallel, recording and returning them in order"""
+        with ThreadPoolExecutor(max_workers=min(len(probes), MAX_WORKERS)) as executor:
+            outcomes = list(executor.map(lambda probe: self.probe(*probe), probes))
+        responses = []
+        for response, status, result, lines in outcomes:
+            self.record(status, result, lines)
+            responses.append(response)
+        return responses
         
     def test_endpoint(self, method, endpoint, description, expected_status=200, 
                      headers=None, data=None, auth_token=None):
         """Test a single API endpoint"""
-        url = urljoin(self.base_url, endpoint)
-        test_headers = headers or {}
+        response, status, result, lines = self.probe(method, endpoint, description, expected_status,
+                                                     headers, data, auth_token)
+        self.record(status, result, lines)
+        return response
+        
+    def probe(self, method, endpoint, description, expected_status=200, 
+              headers=None, data=None, auth_token=None):
+        """Send one request and build its result without recording it (safe on worker threads)"""
+        url = self.url(endpoint)
+        test_headers = dict(headers or {})
         
         if auth_token:
             test_headers['Authorization'] = f'Bearer {auth_token}'
@@ -57,53 +241,57 @@ class APITester:
         if data and method in ['POST', 'PUT']:
             test_headers['Content-Type'] = 'application/json'
             
-        print(f"\n🧪 Testing {method} {endpoint}")
-        print(f"   Description: {description}")
-        print(f"   URL: {url}")
+        lines = [
+            f"\n🧪 Testing {method} {endpoint}",
+            f"   Description: {description}",
+            f"   URL: {url}"
+        ]
         
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             if method == 'GET':
-                response = self.session.get(url, headers=test_headers)
+                response = self.client.get(url, headers=test_headers)
             elif method == 'POST':
-                response = self.session.post(url, headers=test_headers, 
-                                           json=data if data else None)
-            elif method == 'PUT':
-                response = self.session.put(url, headers=test_headers, 
+                response = self.client.post(url, headers=test_headers, 
                                           json=data if data else None)
+            elif method == 'PUT':
+                response = self.client.put(url, headers=test_headers, 
+                                         json=data if data else None)
             elif method == 'DELETE':
-                response = self.session.delete(url, headers=test_headers)
+                response = self.client.delete(url, headers=test_headers)
             elif method == 'OPTIONS':
-                response = self.session.options(url, headers=test_headers)
+                response = self.client.options(url, headers=test_headers)
             else:
                 raise ValueError(f"Unsupported method: {method}")
                 
-            end_time = time.time()
+            end_time = time.perf_counter()
             response_time = round((end_time - start_time) * 1000, 2)
             
             # Check status code
             if response.status_code == expected_status:
-                self.log(f"   ✅ PASS - Status: {response.status_code} ({response_time}ms)", Colors.GREEN)
-                self.results['passed'] += 1
+                lines.append(f"{Colors.GREEN}   ✅ PASS - Status: {response.status_code} ({response_time}ms){Colors.RESET}")
                 status = 'PASS'
             else:
-                self.log(f"   ❌ FAIL - Expected: {expected_status}, Got: {response.status_code}", Colors.RED)
-                self.results['failed'] += 1
+                lines.append(f"{Colors.RED}   ❌ FAIL - Expected: {expected_status}, Got: {response.status_code}{Colors.RESET}")
                 status = 'FAIL'
                 
-            # Try to parse JSON response
-            try:
-                json_response = response.json()
-                print(f"   📄 Response: {json.dumps(json_response, indent=2)[:200]}...")
-            except:
-                if response.text:
-                    print(f"   📄 Response: {response.text[:200]}...")
-                else:
-                    print(f"   📄 Response: (empty)")
+            # Only parse bodies that declare JSON; fall back to the raw text
+            preview = None
+            if is_json(response):
+                try:
+                    preview = json_preview(response_json(response))
+                except ValueError:
+                    pass
+            if preview is None and response.text:
+                preview = response.text[:200]
+                
+            if preview:
+                lines.append(f"   📄 Response: {preview}...")
+            else:
+                lines.append(f"   📄 Response: (empty)")
                     
-            # Store test result
-            self.results['tests'].append({
+            return response, status, {
                 'method': method,
                 'endpoint': endpoint,
                 'description': description,
@@ -112,35 +300,31 @@ class APITester:
                 'actual_status': response.status_code,
                 'response_time': response_time,
                 'url': url
-            })
-            
-            return response
+            }, lines
             
-        except requests.exceptions.RequestException as e:
-            self.log(f"   ❌ ERROR - {str(e)}", Colors.RED)
-            self.results['failed'] += 1
-            self.results['tests'].append({
+        except httpx.HTTPError as e:
+            lines.append(f"{Colors.RED}   ❌ ERROR - {str(e)}{Colors.RESET}")
+            return None, 'ERROR', {
                 'method': method,
                 'endpoint': endpoint,
                 'description': description,
                 'status': 'ERROR',
                 'error': str(e),
                 'url': url
-            })
-            return None
+            }, lines
             
     def test_ssl_certificate(self):
         """Test SSL certificate validity"""
-        print(f"\n🔒 Testing SSL Certificate")
+        self.write(f"\n🔒 Testing SSL Certificate")
         try:
-            context = ssl.create_default_context()
+            context = tls_context()
             with socket.create_connection((DOMAIN, 443), timeout=10) as sock:
                 with context.wrap_socket(sock, server_hostname=DOMAIN) as ssock:
                     cert = ssock.getpeercert()
                     
             self.log(f"   ✅ SSL Certificate Valid", Colors.GREEN)
-            print(f"   📜 Subject: {dict(x[0] for x in cert['subject'])}")
-            print(f"   📅 Valid until: {cert['notAfter']}")
+            self.write(f"   📜 Subject: {dict(x[0] for x in cert['subject'])}")
+            self.write(f"   📅 Valid until: {cert['notAfter']}")
             self.results['passed'] += 1
             
         except Exception as e:
@@ -149,10 +333,10 @@ class APITester:
             
     def test_http_redirect(self):
         """Test HTTP to HTTPS redirect"""
-        print(f"\n🔄 Testing HTTP to HTTPS Redirect")
+        self.write(f"\n🔄 Testing HTTP to HTTPS Redirect")
         try:
             http_url = f"http://{DOMAIN}/"
-            response = requests.get(http_url, allow_redirects=False, timeout=10)
+            response = httpx.get(http_url, follow_redirects=False, timeout=10)
             
             if response.status_code == 301:
                 location = response.headers.get('Location', '')
@@ -175,77 +359,28 @@ class APITester:
         self.log("\n🌐 Basic Connectivity Tests", Colors.CYAN)
         self.log("=" * 50, Colors.CYAN)
         
-        # Test home endpoint
-        self.test_endpoint('GET', '/', 'Home endpoint')
-        
-        # Test health check
-        self.test_endpoint('GET', '/health', 'Backend health check')
-        
-        # Test Nginx health check
-        self.test_endpoint('GET', '/nginx-health', 'Nginx health check')
+        self.run_concurrently(BASIC_PROBES)
         
     def run_public_api_tests(self):
         """Run tests for public API endpoints (no auth required)"""
         self.log("\n📊 Public API Endpoints", Colors.CYAN)
         self.log("=" * 50, Colors.CYAN)
         
-        # Get all issues
-        self.test_endpoint('GET', '/api/v1/issues', 'Get all issues')
-        
-        # Get categories
-        self.test_endpoint('GET', '/api/v1/categories', 'Get issue categories')
-        
-        # Get status options
-        self.test_endpoint('GET', '/api/v1/status-options', 'Get status options')
-        
-        # Get priority options
-        self.test_endpoint('GET', '/api/v1/priority-options', 'Get priority options')
-        
-        # Get system statistics
-        self.test_endpoint('GET', '/api/v1/stats', 'Get system statistics')
-        
-        # Get nearby issues (with sample coordinates)
-        self.test_endpoint('GET', '/api/v1/issues/nearby?lat=12.9716&lng=77.5946&radius=5', 
-                          'Get nearby issues')
-        
-        # Try to get a specific issue (ID 1)
-        self.test_endpoint('GET', '/api/v1/issues/1', 'Get specific issue (ID 1)', 
-                          expected_status=200)  # Might be 404 if no issues exist
+        self.run_concurrently(PUBLIC_PROBES)
         
     def run_auth_tests(self):
         """Run tests for authentication-required endpoints"""
         self.log("\n🔐 Authentication Required Endpoints", Colors.CYAN)
         self.log("=" * 50, Colors.CYAN)
         
-        # These should fail with 401 without authentication
-        self.test_endpoint('GET', '/api/v1/users/me', 'Get current user (no auth)', 
-                          expected_status=401)
-        
-        self.test_endpoint('GET', '/api/v1/auth/test', 'Test authentication (no auth)', 
-                          expected_status=401)
-        
-        self.test_endpoint('POST', '/api/v1/issues', 'Create issue (no auth)', 
-                          expected_status=401)
-        
-        self.test_endpoint('POST', '/api/v1/upload', 'Upload file (no auth)', 
-                          expected_status=401)
+        self.run_concurrently(AUTH_PROBES)
         
     def run_error_handling_tests(self):
         """Run tests for error handling"""
         self.log("\n🧪 Error Handling Tests", Colors.CYAN)
         self.log("=" * 50, Colors.CYAN)
         
-        # Non-existent endpoint
-        self.test_endpoint('GET', '/api/v1/nonexistent', 'Non-existent endpoint', 
-                          expected_status=404)
-        
-        # Invalid issue ID
-        self.test_endpoint('GET', '/api/v1/issues/99999', 'Invalid issue ID', 
-                          expected_status=404)
-        
-        # Invalid method
-        self.test_endpoint('DELETE', '/', 'Invalid method on home endpoint', 
-                          expected_status=405)
+        self.run_concurrently(ERROR_PROBES)
         
     def run_security_tests(self):
         """Run security and performance tests"""
@@ -259,25 +394,14 @@ class APITester:
         self.test_http_redirect()
         
         # Test CORS
-        cors_headers = {
-            'Origin': 'https://example.com',
-            'Access-Control-Request-Method': 'GET'
-        }
         response = self.test_endpoint('OPTIONS', '/api/v1/issues', 'CORS preflight test', 
-                                    expected_status=200, headers=cors_headers)
+                                    expected_status=200, headers=CORS_PREFLIGHT_HEADERS)
         
         # Test security headers
-        print(f"\n🛡️  Testing Security Headers")
+        self.write(f"\n🛡️  Testing Security Headers")
         response = self.test_endpoint('GET', '/', 'Security headers check')
         if response:
-            security_headers = [
-                'X-Frame-Options',
-                'X-Content-Type-Options', 
-                'X-XSS-Protection',
-                'Referrer-Policy'
-            ]
-            
-            for header in security_headers:
+            for header in SECURITY_HEADERS:
                 if header in response.headers:
                     self.log(f"   ✅ {header}: {response.headers[header]}", Colors.GREEN)
                 else:
@@ -290,13 +414,11 @@ class APITester:
         self.log("=" * 50, Colors.CYAN)
         
         # Test response time
-        print(f"\n⏱️  Testing Response Times")
-        endpoints = ['/health', '/api/v1/issues', '/api/v1/categories']
-        
-        for endpoint in endpoints:
-            start_time = time.time()
-            response = self.session.get(urljoin(self.base_url, endpoint))
-            end_time = time.time()
+        self.write(f"\n⏱️  Testing Response Times")
+        for endpoint in PERF_ENDPOINTS:
+            start_time = time.perf_counter()
+            response = self.client.get(self.urls[endpoint])
+            end_time = time.perf_counter()
             response_time = round((end_time - start_time) * 1000, 2)
             
             if response_time < 1000:  # Less than 1 second
@@ -327,33 +449,24 @@ class APITester:
             
         # Print useful URLs
         self.log(f"\n🔗 Useful URLs:", Colors.CYAN)
-        urls = [
-            f"{BASE_URL}/",
-            f"{BASE_URL}/health", 
-            f"{BASE_URL}/api/v1/issues",
-            f"{BASE_URL}/api/v1/categories",
-            f"{BASE_URL}/api/v1/stats"
-        ]
-        
-        for url in urls:
-            print(f"   • {url}")
+        for url in USEFUL_URLS:
+            self.write(f"   • {url}")
             
         # Save detailed results to file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = f"api_test_results_{timestamp}.json"
-        
-        with open(results_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'base_url': self.base_url,
-                'summary': {
-                    'total': total_tests,
-                    'passed': self.results['passed'],
-                    'failed': self.results['failed'],
-                    'warnings': self.results['warnings']
-                },
-                'tests': self.results['tests']
-            }, f, indent=2)
+        # Nanosecond suffix keeps back-to-back runs from overwriting each other
+        results_file = f"api_test_results_{time.time_ns()}.json"
+        
+        write_json(results_file, {
+            'timestamp': self.started_at.isoformat(),
+            'base_url': self.base_url,
+            'summary': {
+                'total': total_tests,
+                'passed': self.results['passed'],
+                'failed': self.results['failed'],
+                'warnings': self.results['warnings']
+            },
+            'tests': self.results['tests']
+        })
             
         self.log(f"\n📄 Detailed results saved to: {results_file}", Colors.BLUE)
         
@@ -362,22 +475,31 @@ class APITester:
         self.log(f"🚀 CivicFix API Testing Suite", Colors.WHITE)
         self.log(f"=" * 50, Colors.WHITE)
         self.log(f"Base URL: {self.base_url}", Colors.WHITE)
-        self.log(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", Colors.WHITE)
+        self.started_at = datetime.now()
+        self.log(f"Started at: {self.started_at.strftime('%Y-%m-%d %H:%M:%S')}", Colors.WHITE)
+        
+        suites = [
+            self.run_basic_tests,
+            self.run_public_api_tests,
+            self.run_auth_tests,
+            self.run_error_handling_tests,
+            self.run_security_tests,
+            self.run_performance_tests
+        ]
         
         try:
-            self.run_basic_tests()
-            self.run_public_api_tests()
-            self.run_auth_tests()
-            self.run_error_handling_tests()
-            self.run_security_tests()
-            self.run_performance_tests()
+            for suite in suites:
+                suite()
+                self.flush()
             
         except KeyboardInterrupt:
             self.log(f"\n⚠️  Testing interrupted by user", Colors.YELLOW)
         except Exception as e:
             self.log(f"\n❌ Unexpected error: {str(e)}", Colors.RED)
         finally:
+            self.client.close()
             self.print_summary()
+            self.flush()
 
 def main():
     """Main function"""
@@ -6,15 +6,38 @@ Tests code syntax, imports, configuration, and structure
 import sys
 import os
 import ast
+import re
 import importlib.util
 from pathlib import Path
 
+# Colors are disabled when output is not a TTY or NO_COLOR is set
+USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
+def ansi(code):
+    """Return the escape sequence only when color output is enabled"""
+    return code if USE_COLOR else ''
+
+# Files that must ship with the backend, with their descriptions
+REQUIRED_FILES = (
+    ('app.py', 'Main application'),
+    ('requirements.txt', 'Requirements'),
+    ('.env.example', 'Environment template'),
+    ('Procfile', 'Procfile'),
+    ('runtime.txt', 'Runtime')
+)
+
+# Modules whose syntax is checked when present
+SYNTAX_FILES = ('app.py', 'init_db.py', 'ai_service_client.py')
+
+# Matches uncommented `NAME=` assignments in env files
+ENV_ASSIGNMENT = re.compile(r'^\s*([A-Za-z_]\w*)\s*=', re.MULTILINE)
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    RESET = '\033[0m'
+    GREEN = ansi('\033[92m')
+    RED = ansi('\033[91m')
+    YELLOW = ansi('\033[93m')
+    BLUE = ansi('\033[94m')
+    RESET = ansi('\033[0m')
 
 def print_test(name, passed, message=""):
     """Print test result"""
@@ -23,18 +46,19 @@ def print_test(name, passed, message=""):
     if message:
         print(f"  {message}")
 
-def test_file_exists(filepath, description):
-    """Test if a file exists"""
-    exists = os.path.exists(filepath)
+def test_file_exists(filepath, description, present=None):
+    """Test if a file exists, optionally against a pre-listed set of names"""
+    exists = filepath in present if present is not None else os.path.exists(filepath)
     print_test(f"{description} exists", exists, filepath if exists else f"Missing: {filepath}")
     return exists
 
 def test_python_syntax(filepath):
     """Test if Python file has valid syntax"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            code = f.read()
-        ast.parse(code)
+        with open(filepath, 'rb') as f:
+            source = f.read()
+        # Parse only: no bytecode is compiled or written
+        ast.parse(source, filename=filepath)
         print_test(f"Syntax: {os.path.basename(filepath)}", True, "Valid Python syntax")
         return True
     except SyntaxError as e:
@@ -139,7 +163,8 @@ def test_env_example():
             'SUPABASE_KEY'
         ]
         
-        missing = [var for var in essential_vars if var not in content]
+        defined = set(ENV_ASSIGNMENT.findall(content))
+        missing = [var for var in essential_vars if var not in defined]
         
         if missing:
             print_test(".env.example", False, f"Missing: {', '.join(missing)}")
@@ -314,28 +339,26 @@ def main():
     
     results = []
     
+    # List the directory once; every existence check below reads from this set
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    
     # File existence tests
     print(f"{Colors.BLUE}=== File Existence Tests ==={Colors.RESET}")
-    results.append(test_file_exists('app.py', 'Main application'))
-    results.append(test_file_exists('requirements.txt', 'Requirements'))
-    results.append(test_file_exists('.env.example', 'Environment template'))
-    results.append(test_file_exists('Procfile', 'Procfile'))
-    results.append(test_file_exists('runtime.txt', 'Runtime'))
+    for filepath, description in REQUIRED_FILES:
+        results.append(test_file_exists(filepath, description, present))
     print()
     
     # Syntax tests
     print(f"{Colors.BLUE}=== Python Syntax Tests ==={Colors.RESET}")
-    if os.path.exists('app.py'):
-        results.append(test_python_syntax('app.py'))
-    if os.path.exists('init_db.py'):
-        results.append(test_python_syntax('init_db.py'))
-    if os.path.exists('ai_service_client.py'):
-        results.append(test_python_syntax('ai_service_client.py'))
+    for filepath in SYNTAX_FILES:
+        if filepath in present:
+            results.append(test_python_syntax(filepath))
     print()
     
     # Import tests
     print(f"{Colors.BLUE}=== Import Tests ==={Colors.RESET}")
-    if os.path.exists('app.py'):
+    if 'app.py' in present:
         results.append(test_imports('app.py'))
     print()
     
@@ -5,6 +5,7 @@ Validates syntax, imports, configuration, runtime, and endpoint logic
 
 import sys
 import os
+import subprocess
 
 print("=" * 70)
 print("CIVICFIX BACKEND - COMPLETE TEST SUITE")
@@ -13,12 +14,12 @@ print("=" * 70)
 # Test 1: Syntax and Structure
 print("\n[1/4] Testing Syntax and Structure...")
 print("-" * 70)
-result1 = os.system("python test_endpoints.py")
+result1 = subprocess.run([sys.executable, "test_endpoints.py"]).returncode
 
 # Test 2: Runtime Initialization
 print("\n[2/4] Testing Runtime Initialization...")
 print("-" * 70)
-result2 = os.system("python test_runtime.py")
+result2 = subprocess.run([sys.executable, "test_runtime.py"]).returncode
 
 # Test 3: Endpoint Logic Validation
 print("\n[3/4] Testing Endpoint Logic...")
@@ -4,8 +4,12 @@ Test script to verify environment variables are loaded correctly
 """
 
 import os
+import re
 from pathlib import Path
 
+# A value wrapped in matching single or double quotes
+QUOTED = re.compile(r'^([\'"])(.*)\1$')
+
 def load_env_file():
     """Load environment variables from .env file"""
     env_file = Path('.env')
@@ -16,25 +20,23 @@ def load_env_file():
     
     print("📄 Loading .env file...")
     
+    parsed = {}
     with open(env_file, 'r') as f:
         for line in f:
             line = line.strip()
             
-            if not line or line.startswith('#'):
+            if not line or line[0] == '#' or '=' not in line:
                 continue
             
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                os.environ[key] = value
+            key, _, value = line.partition('=')
+            value = value.strip()
+            
+            # Remove quotes
+            match = QUOTED.match(value)
+            parsed[key.strip()] = match.group(2) if match else value
+    
+    # Apply everything in one update instead of one setenv per line
+    os.environ.update(parsed)
     
     print("✅ .env file loaded")
     return True
@@ -6,12 +6,15 @@ import json
 
 BASE_URL = "https://civicfixmobbackend.onrender.com"
 
+# Shared keep-alive session: the stats check reuses the init call's TLS connection
+SESSION = requests.Session()
+
 def test_init_db():
     """Test manual database initialization"""
     print("=" * 60)
     print("Testing manual database initialization...")
     print("=" * 60)
-    response = requests.post(f"{BASE_URL}/init-db")
+    response = SESSION.post(f"{BASE_URL}/init-db")
     print(f"Status: {response.status_code}")
     try:
         result = response.json()
@@ -31,7 +34,7 @@ def test_stats_after_init():
     print("=" * 60)
     print("Testing stats endpoint after initialization...")
     print("=" * 60)
-    response = requests.get(f"{BASE_URL}/api/v1/stats")
+    response = SESSION.get(f"{BASE_URL}/api/v1/stats")
     print(f"Status: {response.status_code}")
     try:
         result = response.json()
@@ -7,54 +7,52 @@ import base64
 
 BASE_URL = "https://civicfixmobbackend.onrender.com"
 
-def test_health():
-    """Test health endpoint"""
+# Shared keep-alive session: every check reuses one TLS connection to Render
+SESSION = requests.Session()
+
+def print_header(title):
+    """Print a section banner for one check"""
     print("=" * 60)
-    print("Testing health endpoint...")
+    print(title)
     print("=" * 60)
-    response = requests.get(f"{BASE_URL}/health")
+
+def print_response(response):
+    """Print a response's status and body, pretty-printing JSON when possible"""
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    try:
+        print(f"Response: {json.dumps(response.json(), indent=2)}")
+    except ValueError:
+        print(f"Response: {response.text}")
     print()
 
+def test_health():
+    """Test health endpoint"""
+    print_header("Testing health endpoint...")
+    response = SESSION.get(f"{BASE_URL}/health")
+    print_response(response)
+
 def test_check_user_invalid_token():
     """Test check-user with invalid token"""
-    print("=" * 60)
-    print("Testing check-user with invalid token...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing check-user with invalid token...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/check-user",
         json={"id_token": "invalid_token"}
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_check_user_missing_token():
     """Test check-user with missing token"""
-    print("=" * 60)
-    print("Testing check-user with missing token...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing check-user with missing token...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/check-user",
         json={}
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_create_user_invalid_token():
     """Test create-user with invalid token"""
-    print("=" * 60)
-    print("Testing create-user with invalid token...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing create-user with invalid token...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/create-user",
         json={
             "id_token": "invalid_token",
@@ -62,38 +60,24 @@ def test_create_user_invalid_token():
             "language": "en"
         }
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_create_user_missing_password():
     """Test create-user with missing password"""
-    print("=" * 60)
-    print("Testing create-user with missing password...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing create-user with missing password...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/create-user",
         json={
             "id_token": "test_token",
             "language": "en"
         }
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_create_user_short_password():
     """Test create-user with short password"""
-    print("=" * 60)
-    print("Testing create-user with short password...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing create-user with short password...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/create-user",
         json={
             "id_token": "test_token",
@@ -101,71 +85,38 @@ def test_create_user_short_password():
             "language": "en"
         }
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_login_nonexistent_user():
     """Test login with non-existent user"""
-    print("=" * 60)
-    print("Testing login with non-existent user...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing login with non-existent user...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/login-with-password",
         json={"email": "nonexistent@example.com", "password": "testpassword"}
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_login_missing_fields():
     """Test login with missing fields"""
-    print("=" * 60)
-    print("Testing login with missing email...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing login with missing email...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/login-with-password",
         json={"password": "testpassword"}
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
     
-    print("=" * 60)
-    print("Testing login with missing password...")
-    print("=" * 60)
-    response = requests.post(
+    print_header("Testing login with missing password...")
+    response = SESSION.post(
         f"{BASE_URL}/api/v1/auth/login-with-password",
         json={"email": "test@example.com"}
     )
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_response(response)
 
 def test_database_connection():
     """Test if database is accessible"""
-    print("=" * 60)
-    print("Testing database connection via stats endpoint...")
-    print("=" * 60)
-    response = requests.get(f"{BASE_URL}/api/v1/stats")
-    print(f"Status: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
-    print()
+    print_header("Testing database connection via stats endpoint...")
+    response = SESSION.get(f"{BASE_URL}/api/v1/stats")
+    print_response(response)
 
 if __name__ == "__main__":
     print("\n" + "=" * 60)
@@ -3,8 +3,30 @@ Test Render Deployment
 Quick script to verify your backend is working on Render
 """
 
+import random
 import requests
 import sys
+import time
+
+# Free-tier Render services can take about a minute to wake from sleep
+COLD_START_TIMEOUT = 90
+
+def wait_for_health(session, url, timeout=COLD_START_TIMEOUT, base_delay=0.5, max_delay=8.0):
+    """Poll the health endpoint until it stops failing, backing off with jitter"""
+    deadline = time.monotonic() + timeout
+    delay = base_delay
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            response = session.get(url, timeout=max(1, min(30, remaining)))
+            # 5xx responses come from Render's proxy while the service is still waking
+            if response.status_code < 500 or time.monotonic() >= deadline:
+                return response
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if time.monotonic() >= deadline:
+                raise
+        time.sleep(min(random.uniform(0, delay), max(0, deadline - time.monotonic())))
+        delay = min(delay * 2, max_delay)
 
 def test_deployment(base_url):
     """Test the deployed backend"""
@@ -18,10 +40,14 @@ def test_deployment(base_url):
     tests_passed = 0
     tests_failed = 0
     
+    # One keep-alive session so the later probes reuse the health check's
+    # TCP/TLS connection instead of handshaking again
+    session = requests.Session()
+    
     # Test 1: Health endpoint
     print("Test 1: Health Check...")
     try:
-        response = requests.get(f"{base_url}/health", timeout=30)
+        response = wait_for_health(session, f"{base_url}/health")
         if response.status_code == 200:
             data = response.json()
             print(f"✓ PASS - Status: {data.get('status')}")
@@ -31,7 +57,7 @@ def test_deployment(base_url):
             print(f"✗ FAIL - Status code: {response.status_code}")
             tests_failed += 1
     except requests.exceptions.Timeout:
-        print("✗ FAIL - Request timed out (cold start? try again)")
+        print(f"✗ FAIL - No response within {COLD_START_TIMEOUT}s (cold start? try again)")
         tests_failed += 1
     except Exception as e:
         print(f"✗ FAIL - Error: {e}")
@@ -42,7 +68,7 @@ def test_deployment(base_url):
     # Test 2: Categories endpoint
     print("Test 2: Categories Endpoint...")
     try:
-        response = requests.get(f"{base_url}/api/v1/categories", timeout=10)
+        response = session.get(f"{base_url}/api/v1/categories", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"✓ PASS - Found {len(data.get('categories', []))} categories")
@@ -60,7 +86,7 @@ def test_deployment(base_url):
     print("Test 3: CORS Headers...")
     try:
         headers = {"Origin": "http://localhost:3000"}
-        response = requests.options(f"{base_url}/health", headers=headers, timeout=10)
+        response = session.options(f"{base_url}/health", headers=headers, timeout=10)
         if "access-control-allow-origin" in response.headers:
             print("✓ PASS - CORS enabled")
             tests_passed += 1
@@ -73,6 +99,8 @@ def test_deployment(base_url):
     
     print()
     
+    session.close()
+    
     # Summary
     print("=" * 60)
     print("Test Summary")
@@ -18,6 +18,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Import our storage service
 from app import SupabaseStorageService
 
+# Shared keep-alive session for the public-access checks against Supabase
+SESSION = requests.Session()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -93,7 +96,7 @@ def test_storage_service():
         
         # Test image URL
         try:
-            response = requests.get(image_url, timeout=10)
+            response = SESSION.get(image_url, timeout=10)
             if response.status_code == 200:
                 logger.info(f"✅ Image is publicly accessible (status: {response.status_code})")
             else:
@@ -105,7 +108,7 @@ def test_storage_service():
         
         # Test video URL
         try:
-            response = requests.get(video_url, timeout=10)
+            response = SESSION.get(video_url, timeout=10)
             if response.status_code == 200:
                 logger.info(f"✅ Video is publicly accessible (status: {response.status_code})")
             else: